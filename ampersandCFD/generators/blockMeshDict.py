@@ -75,4 +75,4 @@ mergePatchPairs
 """
     @staticmethod
     def write(mesh_settings: MeshSettings, project_path: Union[str, Path]):
-        Path(f"{project_path}/system/blockMeshDict").write_text(BlockMeshDictGenerator.generate(mesh_settings))
+        GenerationUtils.write_if_changed(Path(project_path, "system/blockMeshDict"), BlockMeshDictGenerator.generate(mesh_settings))
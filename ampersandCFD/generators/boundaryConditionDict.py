@@ -639,10 +639,11 @@ class BoundaryConditionDictGenerator:
         epsilon_file = BoundaryConditionDictGenerator.generate_epsilon_file(mesh_settings, boundary_conditions)
         nut_file = BoundaryConditionDictGenerator.generate_nut_file(mesh_settings, boundary_conditions)
         
-        Path(project_path, "0/U").write_text(u_file)
-        Path(project_path, "0/p").write_text(p_file)
-        Path(project_path, "0/k").write_text(k_file)
-        Path(project_path, "0/omega").write_text(omega_file)
-        Path(project_path, "0/epsilon").write_text(epsilon_file)
-        Path(project_path, "0/nut").write_text(nut_file)
+        zero_dir = Path(project_path, "0")
+        GenerationUtils.write_if_changed(zero_dir / "U", u_file)
+        GenerationUtils.write_if_changed(zero_dir / "p", p_file)
+        GenerationUtils.write_if_changed(zero_dir / "k", k_file)
+        GenerationUtils.write_if_changed(zero_dir / "omega", omega_file)
+        GenerationUtils.write_if_changed(zero_dir / "epsilon", epsilon_file)
+        GenerationUtils.write_if_changed(zero_dir / "nut", nut_file)
 
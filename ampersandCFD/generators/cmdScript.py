@@ -21,7 +21,19 @@ import os
 from pathlib import Path
 from typing import Union
 from ampersandCFD.models.settings import SimulationSettings
-from ampersandCFD.utils.common import crlf_to_LF
+
+# shell scripts need LF line endings on every platform, and are made executable
+# through the open descriptor instead of a separate chmod by path
+def _write_script(path: Path, script: str):
+    if os.name == 'nt':
+        path.write_text(script, newline="\n")
+        return
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+    with open(fd, "w", newline="\n") as f:
+        # the creation mode is filtered by the umask and ignored for existing files
+        os.fchmod(fd, 0o755)
+        f.write(script)
+
 
 class CmdScriptGenerator:
     @staticmethod
@@ -117,18 +129,12 @@ runApplication {solver_name} -postProcess
 
     @staticmethod
     def write(settings: SimulationSettings, project_path: Union[Path, str]):
+        mesh_script = Path(project_path, "mesh")
+        run_script = Path(project_path, "run")
+
         meshScript = CmdScriptGenerator.generate_mesh_script(settings)
-        Path(f"{project_path}/mesh").write_text(meshScript)
+        _write_script(mesh_script, meshScript)
         
         # create simulation script
         simulationScript = CmdScriptGenerator.generate_run_script(settings)
-        Path(f"{project_path}/run").write_text(simulationScript)
-        
-        crlf_to_LF(f"{project_path}/mesh")
-        crlf_to_LF(f"{project_path}/run")
-        
-        mesh_script = Path(project_path) / "mesh"
-        run_script = Path(project_path) / "run"
-        if os.name != 'nt':
-            mesh_script.chmod(0o755)
-            run_script.chmod(0o755)
\ No newline at end of file
+        _write_script(run_script, simulationScript)
@@ -58,5 +58,6 @@ class ConstantDictGenerator:
 
     @staticmethod
     def write(physical_properties: PhysicalProperties, project_path: Union[str, Path]):
-        Path(f"{project_path}/constant/transportProperties").write_text(ConstantDictGenerator.generate_transport_dict(physical_properties))
-        Path(f"{project_path}/constant/turbulenceProperties").write_text(ConstantDictGenerator.generate_turbulence_dict(physical_properties))
+        constant_dir = Path(project_path, "constant")
+        GenerationUtils.write_if_changed(constant_dir / "transportProperties", ConstantDictGenerator.generate_transport_dict(physical_properties))
+        GenerationUtils.write_if_changed(constant_dir / "turbulenceProperties", ConstantDictGenerator.generate_turbulence_dict(physical_properties))
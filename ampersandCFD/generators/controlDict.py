@@ -56,4 +56,4 @@ libs
 
     @staticmethod
     def write(control_settings: ControlSettings, project_path: Union[str, Path]):
-        Path(f"{project_path}/system/controlDict").write_text(ControlDictGenerator.generate(control_settings))
+        GenerationUtils.write_if_changed(Path(project_path, "system/controlDict"), ControlDictGenerator.generate(control_settings))
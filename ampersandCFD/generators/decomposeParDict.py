@@ -33,4 +33,4 @@ method {parallel_settings.method};
 
     @staticmethod
     def write(parallel_settings: ParallelSettings, project_path: Union[str, Path]):
-        Path(f"{project_path}/system/decomposeParDict").write_text(DecomposeParDictGenerator.generate(parallel_settings))
+        GenerationUtils.write_if_changed(Path(project_path, "system/decomposeParDict"), DecomposeParDictGenerator.generate(parallel_settings))
@@ -245,9 +245,10 @@ class FVDictGenerator:
 
     @staticmethod
     def write(numerical_settings: NumericalSettings, solver_settings: SolverSettings, project_path: Union[str, Path]):
+        system_dir = Path(project_path, "system")
         fvSchemesDict = FVDictGenerator.generate_fvSchemes(numerical_settings)
-        Path(f"{project_path}/system/fvSchemes").write_text(fvSchemesDict)        
+        GenerationUtils.write_if_changed(system_dir / "fvSchemes", fvSchemesDict)
 
         fvSolutionDict = FVDictGenerator.generate_fvsolution(numerical_settings, solver_settings)
-        Path(f"{project_path}/system/fvSolution").write_text(fvSolutionDict)
+        GenerationUtils.write_if_changed(system_dir / "fvSolution", fvSolutionDict)
         
\ No newline at end of file
@@ -19,6 +19,7 @@
 
 from pathlib import Path
 from typing import Literal, Union
+from ampersandCFD.utils.generation import GenerationUtils
 from ampersandCFD.utils.io import IOUtils
 from ampersandCFD.models.settings import MeshSettings, PostProcessSettings, Location
 
@@ -200,4 +201,4 @@ streamLines
     def write(mesh_settings: MeshSettings, post_process_settings: PostProcessSettings, project_path: Union[str, Path]):
         # Path(f"{project_path}/system/postProcessDict").write_text(PostProcess.generate_FOs(mesh_settings, post_process_settings))
         # Path(f"{project_path}/Allrun_postProcess").write_text(PostProcess.generate_post_process_script())
-        Path(f"{project_path}/system/FOs").write_text(PostProcessGenerator.generate_FOs(mesh_settings, post_process_settings))
\ No newline at end of file
+        GenerationUtils.write_if_changed(Path(project_path, "system/FOs"), PostProcessGenerator.generate_FOs(mesh_settings, post_process_settings))
\ No newline at end of file
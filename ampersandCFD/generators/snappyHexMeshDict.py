@@ -37,7 +37,6 @@ class SnappyHexMeshDictGenerator:
         str: The content of the snappyHexMeshDict file as a string.
         """
         snappyHexMeshDict = f""
-        trueFalse = {True: "true", False: "false"}
         header = GenerationUtils.createFoamHeader(
             className="dictionary", objectName="snappyHexMeshDict")
 
@@ -327,4 +326,4 @@ class SnappyHexMeshDictGenerator:
 
     @staticmethod
     def write(mesh_settings: SnappyHexMeshSettings, project_path: Union[str, Path]):
-        Path(f"{project_path}/system/snappyHexMeshDict").write_text(SnappyHexMeshDictGenerator.generate(mesh_settings))
+        GenerationUtils.write_if_changed(Path(project_path, "system/snappyHexMeshDict"), SnappyHexMeshDictGenerator.generate(mesh_settings))
@@ -47,4 +47,4 @@ class SurfaceExtractorDictGenerator:
 
     @staticmethod
     def write(mesh_settings: MeshSettings, type: SurfaceExtractObjectType, project_path: Union[str, Path]):
-        Path(f"{project_path}/system/{type}").write_text(SurfaceExtractorDictGenerator.generate(mesh_settings, type))
+        GenerationUtils.write_if_changed(Path(project_path, "system", type), SurfaceExtractorDictGenerator.generate(mesh_settings, type))
@@ -3,7 +3,7 @@ from typing import Optional, Union
 from PySide6.QtWidgets import QApplication
 from PySide6.QtUiTools import QUiLoader
 from PySide6.QtWidgets import QVBoxLayout
-from PySide6.QtCore import QFile
+from PySide6.QtCore import QFile, QTimer, Qt, Signal
 from PySide6.QtWidgets import QMainWindow
 from PySide6 import QtWidgets
 from vtk.qt.QVTKRenderWindowInteractor import QVTKRenderWindowInteractor
@@ -15,7 +15,6 @@ import vtk
 from vtkmodules.vtkInteractionWidgets import vtkOrientationMarkerWidget
 # ------------------------------------------------- #
 import sys
-from time import sleep
 
 # Connection to the Ampersand Backend
 from ampersandCFD.models.project import AmpersandProject
@@ -47,9 +46,38 @@ def readSTL(stlFileName="cylinder.stl"):
 # This is the main window class
 class MainWindow(QMainWindow):
     project: AmpersandProject
+    log_signal = Signal(str)
     def __init__(self):
         super().__init__()
         self.load_ui()
+        # widgets that are only usable while a project is open
+        # (pushButtonCreate and pushButtonOpen always stay enabled)
+        self._toggle_widgets = (
+            self.window.pushButtonSTLImport,
+            self.window.pushButtonSphere,
+            self.window.pushButtonBox,
+            self.window.pushButtonCylinder,
+            self.window.radioButtonInternal,
+            self.window.radioButtonExternal,
+            self.window.checkBoxOnGround,
+            self.window.pushButtonSTLProperties,
+            self.window.pushButtonPhysicalProperties,
+            self.window.pushButtonBoundaryCondition,
+            self.window.pushButtonNumerics,
+            self.window.pushButtonControls,
+            self.window.pushButtonDomainAuto,
+            self.window.pushButtonDomainManual,
+            self.window.pushButtonGenerate,
+            self.window.lineEditMinX,
+            self.window.lineEditMinY,
+            self.window.lineEditMinZ,
+            self.window.lineEditMaxX,
+            self.window.lineEditMaxY,
+            self.window.lineEditMaxZ,
+            self.window.lineEdit_nX,
+            self.window.lineEdit_nY,
+            self.window.lineEdit_nZ,
+        )
         self.current_stl_path: Optional[Path] = None
         self.surfaces = []
         self.project_opened = False
@@ -60,32 +88,7 @@ class MainWindow(QMainWindow):
         self.disableButtons()
 
     def disableButtons(self):
-        self.window.pushButtonSTLImport.setEnabled(False)
-        self.window.pushButtonSphere.setEnabled(False)
-        self.window.pushButtonBox.setEnabled(False)
-        self.window.pushButtonCylinder.setEnabled(False)
-        self.window.radioButtonInternal.setEnabled(False)
-        self.window.radioButtonExternal.setEnabled(False)
-        self.window.checkBoxOnGround.setEnabled(False)
-        self.window.pushButtonSTLProperties.setEnabled(False)
-        self.window.pushButtonPhysicalProperties.setEnabled(False)
-        self.window.pushButtonBoundaryCondition.setEnabled(False)
-        self.window.pushButtonNumerics.setEnabled(False)
-        self.window.pushButtonControls.setEnabled(False)
-        self.window.pushButtonDomainAuto.setEnabled(False)
-        self.window.pushButtonDomainManual.setEnabled(False)
-        # self.window.pushButtonCreate.setEnabled(False)
-        # self.window.pushButtonOpen.setEnabled(False)
-        self.window.pushButtonGenerate.setEnabled(False)
-        self.window.lineEditMinX.setEnabled(False)
-        self.window.lineEditMinY.setEnabled(False)
-        self.window.lineEditMinZ.setEnabled(False)
-        self.window.lineEditMaxX.setEnabled(False)
-        self.window.lineEditMaxY.setEnabled(False)
-        self.window.lineEditMaxZ.setEnabled(False)
-        self.window.lineEdit_nX.setEnabled(False)
-        self.window.lineEdit_nY.setEnabled(False)
-        self.window.lineEdit_nZ.setEnabled(False)
+        self._set_enabled(False)
         # change color of widget
         self.window.widget.setStyleSheet('''background-color: lightgrey;''')
         # change color of text box
@@ -99,32 +102,11 @@ class MainWindow(QMainWindow):
             "Welcome to Ampersand CFD GUI")
 
     def enableButtons(self):
-        self.window.pushButtonSTLImport.setEnabled(True)
-        self.window.pushButtonSphere.setEnabled(True)
-        self.window.pushButtonBox.setEnabled(True)
-        self.window.pushButtonCylinder.setEnabled(True)
-        self.window.radioButtonInternal.setEnabled(True)
-        self.window.radioButtonExternal.setEnabled(True)
-        self.window.checkBoxOnGround.setEnabled(True)
-        self.window.pushButtonSTLProperties.setEnabled(True)
-        self.window.pushButtonPhysicalProperties.setEnabled(True)
-        self.window.pushButtonBoundaryCondition.setEnabled(True)
-        self.window.pushButtonNumerics.setEnabled(True)
-        self.window.pushButtonControls.setEnabled(True)
-        self.window.pushButtonCreate.setEnabled(True)
-        self.window.pushButtonOpen.setEnabled(True)
-        self.window.pushButtonGenerate.setEnabled(True)
-        self.window.pushButtonDomainAuto.setEnabled(True)
-        self.window.pushButtonDomainManual.setEnabled(True)
-        self.window.lineEditMinX.setEnabled(True)
-        self.window.lineEditMinY.setEnabled(True)
-        self.window.lineEditMinZ.setEnabled(True)
-        self.window.lineEditMaxX.setEnabled(True)
-        self.window.lineEditMaxY.setEnabled(True)
-        self.window.lineEditMaxZ.setEnabled(True)
-        self.window.lineEdit_nX.setEnabled(True)
-        self.window.lineEdit_nY.setEnabled(True)
-        self.window.lineEdit_nZ.setEnabled(True)
+        self._set_enabled(True)
+
+    def _set_enabled(self, on: bool):
+        for widget in self._toggle_widgets:
+            widget.setEnabled(on)
 
     def load_ui(self):
         ui_file = QFile("qfiles/ampersandInputForm.ui")
@@ -134,10 +116,10 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("Ampersand Input Form")
         self.prepare_vtk()
         self.prepare_subWindows()
+        self.prepare_terminal()
         self.prepare_events()
 
-        IOUtils.window = self
-        IOUtils.GUIMode = True
+        IOUtils.configure(window=self, gui=True)
 
     def __del__(self):
         pass
@@ -174,6 +156,18 @@ class MainWindow(QMainWindow):
     def prepare_subWindows(self):
         self.createCaseWindow = None
 
+    # terminal messages are buffered and flushed at ~30 Hz so that bursts of
+    # IOUtils.print calls do not re-layout the text box once per message
+    def prepare_terminal(self):
+        self._log_buf: list[str] = []
+        # queued so messages emitted from any thread are buffered on the GUI thread
+        self.log_signal.connect(self._queue_log, Qt.QueuedConnection)
+        self.window.plainTextTerminal.document().setMaximumBlockCount(2000)
+        self._log_timer = QTimer(self)
+        self._log_timer.setInterval(33)
+        self._log_timer.timeout.connect(self._flush_log)
+        self._log_timer.start()
+
     def prepare_vtk(self):
         # Prepare the VTK widget to show the STL
         self.vl = QVBoxLayout()
@@ -202,9 +196,14 @@ class MainWindow(QMainWindow):
     def showSTL(self, stlFile: Union[str, Path]):
         # Read stl
         try:
-            self.reader = vtk.vtkSTLReader()
-            self.reader.SetFileName(str(stlFile))
-            self.render3D()
+            # read once and keep only the polydata, so the reader (and its
+            # file handle) is not part of the rendering pipeline
+            reader = vtk.vtkSTLReader()
+            reader.SetFileName(str(stlFile))
+            reader.Update()
+            poly_data = vtk.vtkPolyData()
+            poly_data.ShallowCopy(reader.GetOutput())
+            self.render3D(poly_data)
         except:
             IOUtils.print("Reading STL not successful. Try again")
 
@@ -216,15 +215,8 @@ class MainWindow(QMainWindow):
         actor = vtk.vtkActor()
         # actor.SetMapper(mapper)
         actor.GetProperty().EdgeVisibilityOn()
+        # the gradient background is already set up in prepare_vtk
         colors = vtk.vtkNamedColors()
-        whiteColor = colors.GetColor3d("White")
-        blackColor = colors.GetColor3d("Black")
-        # deepBlue = colors.GetColor3d("DeepBlue")
-        # self.ren.SetBackground(colors.GetColor3d("SlateGray"))
-        # set background color as gradient
-        self.ren.GradientBackgroundOn()
-        self.ren.SetBackground(whiteColor)
-        self.ren.SetBackground2(blackColor)
         self.ren.AddActor(actor)
         style = vtk.vtkInteractorStyleTrackballCamera()
         self.iren.SetInteractorStyle(style)
@@ -247,12 +239,16 @@ class MainWindow(QMainWindow):
         widget.SetEnabled(1)
         widget.InteractiveOn()
         self.ren.AddActor(axes)
-        self.iren.Start()
+        # keep a reference so the orientation widget is not garbage collected
+        self.orientationWidget = widget
+        # Qt owns the event loop, so the interactor must not be started here
 
-    def render3D(self):  # self.ren and self.iren must be used. other variables are local variables
+    def render3D(self, poly_data: vtk.vtkPolyData):  # self.ren and self.iren must be used. other variables are local variables
         # Create a mapper
         mapper = vtk.vtkPolyDataMapper()
-        mapper.SetInputConnection(self.reader.GetOutputPort())
+        mapper.SetInputData(poly_data)
+        # loaded STL surfaces never change, so upload them to the GPU once
+        mapper.SetStatic(1)
         # Create an actor
         actor = vtk.vtkActor()
         actor.SetMapper(mapper)
@@ -268,6 +264,7 @@ class MainWindow(QMainWindow):
         # Create a mapper
         mapper = vtk.vtkPolyDataMapper()
         mapper.SetInputConnection(object.GetOutputPort())
+        mapper.SetStatic(1)
         # Create an actor
         actor = vtk.vtkActor()
         actor.GetProperty().SetOpacity(opacity)
@@ -282,7 +279,7 @@ class MainWindow(QMainWindow):
                 if (act.GetProperty().GetObjectName() == objectName):
                     self.ren.RemoveActor(act)
         self.ren.AddActor(actor)
-        self.iren.Start()
+        self.vtkWidget.GetRenderWindow().Render()
 
     def add_sphere_to_VTK(self):
         # Create a sphere
@@ -317,7 +314,7 @@ class MainWindow(QMainWindow):
         currentActors = self.ren.GetActors()
 
         # self.ren.ResetCamera()
-        self.iren.Start()
+        self.vtkWidget.GetRenderWindow().Render()
 
     def loadSTL(self, stlFile=r"C:\Users\mrtha\Desktop\GitHub\foamAutoGUI\src\pipe.stl"):
         IOUtils.print("Loading STL file")
@@ -344,14 +341,21 @@ class MainWindow(QMainWindow):
 
     def updateStatusBar(self, message="Go!"):
         self.window.statusbar.showMessage(message)
-        self.window.plainTextTerminal.appendPlainText(message)
+        self.log_signal.emit(message)
 
-    def updateTerminal(self, message="Go!"):
-        self.window.plainTextTerminal.appendPlainText(message)
+    def updateTerminal(self, *args):
+        self.log_signal.emit(' '.join(map(str, args)) if args else "Go!")
+
+    def _queue_log(self, message: str):
+        self._log_buf.append(message)
+
+    def _flush_log(self):
+        if not self._log_buf:
+            return
+        self.window.plainTextTerminal.appendPlainText("\n".join(self._log_buf))
+        self._log_buf.clear()
 
     def readyStatusBar(self):
-        # pause 1 millisecond
-        sleep(0.001)
         self.window.statusbar.showMessage("Ready")
 
     def prepare_events(self):
@@ -404,7 +408,6 @@ class MainWindow(QMainWindow):
         self.project.settings.mesh.internalFlow = True
         self.window.checkBoxOnGround.setEnabled(False)
         self.updateStatusBar("Choosing Internal Flow")
-        sleep(0.001)
         self.readyStatusBar()
 
     def chooseExternalFlow(self):
@@ -414,7 +417,6 @@ class MainWindow(QMainWindow):
         )
         self.project.settings.mesh.onGround = self.window.checkBoxOnGround.isChecked()
         self.updateStatusBar("Choosing External Flow")
-        sleep(0.001)
         self.readyStatusBar()
 
     def createCase(self):
@@ -445,8 +447,6 @@ class MainWindow(QMainWindow):
         self.ren.RemoveAllViewProps()
         # clear the list widget
         self.window.listWidgetObjList.clear()
-        IOUtils.window = self.window
-        IOUtils.GUIMode = True
 
         parent_directory = IOUtils.ask_for_directory(qt=True)
         project_name = IOUtils.get_input("Enter the project name: ")
@@ -529,15 +529,10 @@ class MainWindow(QMainWindow):
         onGround = self.window.checkBoxOnGround.isChecked()
         self.project.settings.mesh.onGround = onGround
         IOUtils.print("On Ground: ", onGround)
-        minx = self.project.settings.mesh.domain.minx
-        miny = self.project.settings.mesh.domain.miny
-        minz = self.project.settings.mesh.domain.minz
-        maxx = self.project.settings.mesh.domain.maxx
-        maxy = self.project.settings.mesh.domain.maxy
-        maxz = self.project.settings.mesh.domain.maxz
-        nx = self.project.settings.mesh.domain.nx
-        ny = self.project.settings.mesh.domain.ny
-        nz = self.project.settings.mesh.domain.nz
+        domain = self.project.settings.mesh.domain
+        minx, miny, minz = domain.minx, domain.miny, domain.minz
+        maxx, maxy, maxz = domain.maxx, domain.maxy, domain.maxz
+        nx, ny, nz = domain.nx, domain.ny, domain.nz
         self.window.lineEditMinX.setText(f"{minx:.2f}")
         self.window.lineEditMinY.setText(f"{miny:.2f}")
         self.window.lineEditMinZ.setText(f"{minz:.2f}")
@@ -568,15 +563,10 @@ class MainWindow(QMainWindow):
             IOUtils.error("Invalid Domain Size")
             self.readyStatusBar()
             return
-        self.project.settings.mesh.domain.minx = minx
-        self.project.settings.mesh.domain.miny = miny
-        self.project.settings.mesh.domain.minz = minz
-        self.project.settings.mesh.domain.maxx = maxx
-        self.project.settings.mesh.domain.maxy = maxy
-        self.project.settings.mesh.domain.maxz = maxz
-        self.project.settings.mesh.domain.nx = nx
-        self.project.settings.mesh.domain.ny = ny
-        self.project.settings.mesh.domain.nz = nz
+        domain = self.project.settings.mesh.domain
+        domain.minx, domain.miny, domain.minz = minx, miny, minz
+        domain.maxx, domain.maxy, domain.maxz = maxx, maxy, maxz
+        domain.nx, domain.ny, domain.nz = nx, ny, nz
         self.updateStatusBar("Manual Domain Set")
         self.add_box_to_VTK(minX=minx, minY=miny, minZ=minz,
                             maxX=maxx, maxY=maxy, maxZ=maxz, boxName="Domain")
@@ -1,6 +1,6 @@
 from pathlib import Path
 from typing import Literal, Optional, Union
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from ampersandCFD.models.settings import RefinementAmount, FluidProperties, PatchType, PatchProperty, TransientInput
 
 PathLike = Union[str, Path]
@@ -12,13 +12,21 @@ FLUID_PYSICAL_PROPERTIES = {
     "Water": FluidProperties(rho= 1000, nu= 1e-6),
 }
 
+def get_fluid(name: str) -> FluidProperties:
+    """Return the shared (immutable) preset instance for a named fluid."""
+    return FLUID_PYSICAL_PROPERTIES[name]
+
 class StlInput(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     stl_path: PathLike
     purpose: PatchType
     property: Optional[PatchProperty] = None
 
 
 class CreateProjectInput(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     refinement_amount: RefinementAmount
     is_internal_flow: bool
     fluid: FluidProperties
@@ -16,106 +16,175 @@
  * You may obtain a copy of the license at https://www.gnu.org/licenses/gpl-3.0.en.html
  */
 """
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Union
+from typing import Callable, Optional, Union
 from ampersandCFD.models.settings import SimulationSettings, TriSurfaceMeshGeometry, PatchType, PatchProperty
 from ampersandCFD.utils.io import IOUtils
 
 
+# Listing of constant/triSurface keyed by the directory mtime, so repeated
+# summaries/GUI refreshes only cost a single stat until the directory changes
+@lru_cache(maxsize=32)
+def _scan_stl_dir(dir_path: str, mtime_ns: int) -> tuple[Path, ...]:
+    with os.scandir(dir_path) as entries:
+        return tuple(Path(entry.path) for entry in entries if entry.name.endswith(".stl") and entry.is_file())
+
+
+# geometry types that refine the mesh rather than bound it
+_REFINEMENT_TYPES = frozenset({'refinementRegion', 'refinementSurface'})
+
+# Row templates for the summary tables
+_BC_ROW = "{:<5}{:<20}{:<20}{:<15}".format
+_STL_ROW = "{:<5}{:<20}{:<20}({} {}{:<11}{:<15}".format
+_STL_HEADER = "{:<5}{:<20}{:<20}{:<15}{:<15}".format('No.', 'Name', 'Purpose', 'RefineMent', 'Property')
+
+# Formatting of the "Property" column of the STL summary, keyed by the property's type
+def _format_vector_property(geometry: TriSurfaceMeshGeometry) -> str:
+    x, y, z = geometry.property  # type: ignore
+    return f"[{x} {y} {z}]"
+
+def _format_none_property(geometry: TriSurfaceMeshGeometry) -> str:
+    return f"nLayers: {geometry.nLayers}" if geometry.type == 'wall' else "None"
+
+def _format_tuple_property(geometry: TriSurfaceMeshGeometry) -> str:
+    if geometry.type == 'inlet':
+        return f"U: {_format_vector_property(geometry)}"
+    elif geometry.type == 'cellZone':
+        return f"Refinement: {geometry.property[0]}"  # type: ignore
+    return _format_vector_property(geometry)
+
+def _format_default_property(geometry: TriSurfaceMeshGeometry) -> str:
+    return str(geometry.property)
+
+_PROPERTY_FORMATTERS: dict[type, Callable[[TriSurfaceMeshGeometry], str]] = {
+    type(None): _format_none_property,
+    list: _format_vector_property,
+    tuple: _format_tuple_property,
+}
+
+def format_stl_property(geometry: TriSurfaceMeshGeometry) -> str:
+    return _PROPERTY_FORMATTERS.get(type(geometry.property), _format_default_property)(geometry)
+
+
 class AmpersandProject: 
+    __slots__ = ('_settings', '_project_path', '_name', '_dirs_ensured')
+
     def __init__(self, project_path: Union[str, Path], settings: Optional[SimulationSettings] = None):
-        self.settings = settings or SimulationSettings()
-        self.project_path = Path(project_path)
+        self._settings = settings
+        self.project_path = project_path
+        self._dirs_ensured: set[Path] = set()
+
+    @property
+    def settings(self) -> SimulationSettings:
+        # default settings are only built when first needed
+        if self._settings is None:
+            self._settings = SimulationSettings()
+        return self._settings
+
+    @settings.setter
+    def settings(self, settings: SimulationSettings):
+        self._settings = settings
     
+    @property
+    def project_path(self) -> Path:
+        return self._project_path
+
+    @project_path.setter
+    def project_path(self, project_path: Union[str, Path]):
+        self._project_path = Path(project_path)
+        # name is derived from the path, so it is cached alongside it
+        self._name = self._project_path.name
+
     @property
     def name(self):
-        return self.project_path.name
+        return self._name
 
     def update_patch(self, name: str, type: PatchType, property: Optional[PatchProperty] = None):
-        if not self.settings.mesh.internalFlow:  # if it is external flow
-            bcPatches = self.settings.mesh.patches
+        mesh = self.settings.mesh
+        # blockMesh patches are only boundaries for external flow
+        bcPatches = mesh.patches if not mesh.internalFlow else {}
 
-        if name in bcPatches:
-            self.settings.mesh.patches[name].type = type
-            self.settings.mesh.patches[name].property = property
-            IOUtils.print(f"Boundary Patch {name} changed to {type} with property {property}")
-        elif name in self.settings.mesh.geometry:
-            self.settings.mesh.patches[name].type = type
-            self.settings.mesh.patches[name].property = property
-            IOUtils.print(f"Geometry Patch {name} changed to {type} with property {property}")
+        patch, kind = bcPatches.get(name), "Boundary"
+        if patch is None:
+            patch, kind = mesh.geometry.get(name), "Geometry"
+        if patch is None:
+            raise ValueError(f"Boundary condition {name} not found")
 
-        raise ValueError(f"Boundary condition {name} not found")
+        patch.type = type
+        patch.property = property
+        IOUtils.print(f"{kind} Patch {name} changed to {type} with property {property}")
 
 
     def summarize_project(self):
-        IOUtils.show_title("Project Summary")
-
-        IOUtils.print(f"Internal Flow: {self.settings.mesh.internalFlow}")
-        if (self.settings.mesh.internalFlow == False):
-            IOUtils.print(f"On Ground: {self.settings.mesh.onGround}")
-        IOUtils.print(f"Transient: {self.settings.control.transient}")
-        IOUtils.print(self.settings.mesh.domain.__repr__())
+        settings = self.settings
+        mesh = settings.mesh
+        lines = [IOUtils.format_title("Project Summary"), f"Internal Flow: {mesh.internalFlow}"]
+        if (mesh.internalFlow == False):
+            lines.append(f"On Ground: {mesh.onGround}")
+        lines.append(f"Transient: {settings.control.transient}")
+        lines.append(mesh.domain.__repr__())
+        IOUtils.print_block(lines)
         self.summarize_stl_files()
 
     def summarize_boundary_conditions(self):
         boundaries = []
-        IOUtils.show_title("Boundary Conditions")
-        IOUtils.print(f"{'No.':<5}{'Name':<20}{'Purpose':<20}{'Value':<15}")
+        lines = [IOUtils.format_title("Boundary Conditions"), _BC_ROW('No.', 'Name', 'Purpose', 'Value')]
 
+        mesh = self.settings.mesh
         # Handle external flow boundary conditions first
-        if not self.settings.mesh.internalFlow:
-            for i, (patch_name, patch) in enumerate(self.settings.mesh.patches.items(), 1):
-                IOUtils.print(f"{i:<5}{patch_name:<20}{patch.type:<20}{str(patch.property):<15}")
+        if not mesh.internalFlow:
+            for i, (patch_name, patch) in enumerate(mesh.patches.items(), 1):
+                lines.append(_BC_ROW(i, patch_name, patch.type, str(patch.property)))
                 boundaries.append(patch_name)
 
         # Handle geometry boundary conditions 
         start_i = len(boundaries) + 1
-        for i, (patch_name, patch) in enumerate(self.settings.mesh.geometry.items(), start_i):
-            if patch.type not in ['refinementRegion', 'refinementSurface']:
-                IOUtils.print(f"{i:<5}{patch_name:<20}{patch.type:<20}{str(patch.property):<15}")
+        for i, (patch_name, patch) in enumerate(mesh.geometry.items(), start_i):
+            if patch.type not in _REFINEMENT_TYPES:
+                lines.append(_BC_ROW(i, patch_name, patch.type, str(patch.property)))
                 boundaries.append(patch_name)
 
+        IOUtils.print_block(lines)
         return boundaries
 
     def summarize_stl_files(self):
         stl_files: list[str] = []
+        lines: list[str] = []
+        stl_geometries = self.settings.mesh.triSurfaceMeshGeometry
         if IOUtils.GUIMode:
-            for i, (geometry_name, geometry) in enumerate(self.settings.mesh.geometry.items()):
-                if isinstance(geometry, TriSurfaceMeshGeometry):
-                    IOUtils.print(f"{i+1}. {geometry_name}")
-                    stl_files.append(geometry_name)
-            return stl_files
-            
-        IOUtils.show_title("STL Files")
-
-        IOUtils.print(f"{'No.':<5}{'Name':<20}{'Purpose':<20}{'RefineMent':<15}{'Property':<15}")
-        for i, (geometry_name, geometry) in enumerate(self.settings.mesh.geometry.items()):
-            if isinstance(geometry, TriSurfaceMeshGeometry):
-                if (geometry.property == None):
-                    stl_property = "None"
-                    if geometry.type == 'wall':
-                        stl_property = f"nLayers: {geometry.nLayers}"
-                    else:
-                        stl_property = "None"
-                elif isinstance(geometry.property, list):
-                    stl_property = f"[{geometry.property[0]} {
-                        geometry.property[1]} {geometry.property[2]}]"
-                elif isinstance(geometry.property, tuple):
-                    if geometry.type == 'inlet':
-                        stl_property = f"U: [{geometry.property[0]} {
-                            geometry.property[1]} {geometry.property[2]}]"
-                    elif geometry.type == 'cellZone':
-                        stl_property = f"Refinement: {geometry.property[0]}"
-                else:
-                    stl_property = geometry.property
-                IOUtils.print(f"{i+1:<5}{geometry_name:<20}{geometry.type:<20}({geometry.refineMin} {geometry.refineMax}{')':<11}{stl_property:<15}")
+            for i, geometry_name in enumerate(stl_geometries, 1):
+                lines.append(f"{i}. {geometry_name}")
                 stl_files.append(geometry_name)
-        IOUtils.print_line()
+            IOUtils.print_block(lines)
+            return stl_files
+
+        lines.append(IOUtils.format_title("STL Files"))
+        lines.append(_STL_HEADER)
+        for i, (geometry_name, geometry) in enumerate(stl_geometries.items(), 1):
+            stl_property = format_stl_property(geometry)
+            lines.append(_STL_ROW(i, geometry_name, geometry.type, geometry.refineMin, geometry.refineMax, ')', stl_property))
+            stl_files.append(geometry_name)
+        lines.append("-"*60)
+        IOUtils.print_block(lines)
         return stl_files
 
 
     def get_stl_paths(self):
-        stl_dir = Path(self.project_path) / "constant" / "triSurface"
-        if not stl_dir.exists():
+        stl_dir = self.project_path / "constant" / "triSurface"
+        try:
+            mtime_ns = stl_dir.stat().st_mtime_ns
+        except FileNotFoundError:
             return []
-        return list(stl_dir.glob("*.stl"))
\ No newline at end of file
+        return list(_scan_stl_dir(str(stl_dir), mtime_ns))
+
+    def ensure_directory(self, directory: Path):
+        """Create directory (and parents) once per project instance."""
+        if directory not in self._dirs_ensured:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._dirs_ensured.add(directory)
+
+    @staticmethod
+    def clear_stl_cache():
+        _scan_stl_dir.cache_clear()
@@ -17,7 +17,7 @@
  */
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Dict, List, Literal, Union, Optional, cast
 
 
@@ -25,6 +25,9 @@ from typing import Dict, List, Literal, Union, Optional, cast
 Location = tuple[float, float, float]
 RefinementAmount = Literal["coarse", "medium", "fine"]
 class FluidProperties(BaseModel):
+    # frozen so the presets in FLUID_PYSICAL_PROPERTIES can be shared between projects
+    model_config = ConfigDict(frozen=True)
+
     rho: float
     nu: float
 
@@ -86,15 +89,25 @@ class BoundingBox(BaseModel):
         """
         return min(*self.size)
 
-    def scale_dimensions(self, xmin_offset: float = 0.0, xmax_offset: float = 0.0, ymin_offset: float = 0.0, ymax_offset: float = 0.0, zmin_offset: float = 0.0, zmax_offset: float = 0.0):
+    def contains(self, point) -> bool:
+        """
+        Check whether a point lies inside the bounding box, boundary included.
 
-        return BoundingBox(
-            minx = self.minx + xmin_offset,
-            maxx = self.maxx + xmax_offset,
-            miny = self.miny + ymin_offset,
-            maxy = self.maxy + ymax_offset,
-            minz = self.minz + zmin_offset,
-            maxz = self.maxz + zmax_offset
+        Returns:
+            bool: True if the (x, y, z) point is within the bounds.
+        """
+        x, y, z = point
+        return self.minx <= x <= self.maxx and self.miny <= y <= self.maxy and self.minz <= z <= self.maxz
+
+    def scale_dimensions(self, xmin_offset: float = 0.0, xmax_offset: float = 0.0, ymin_offset: float = 0.0, ymax_offset: float = 0.0, zmin_offset: float = 0.0, zmax_offset: float = 0.0):
+        # the bounds are already validated floats, so the shifted box is built without re-validation
+        return BoundingBox.model_construct(
+            minx = float(self.minx + xmin_offset),
+            maxx = float(self.maxx + xmax_offset),
+            miny = float(self.miny + ymin_offset),
+            maxy = float(self.maxy + ymax_offset),
+            minz = float(self.minz + zmin_offset),
+            maxz = float(self.maxz + zmax_offset)
         )
 
     @staticmethod
@@ -113,6 +126,9 @@ class BoundingBox(BaseModel):
 
 
 
+# Background mesh line of the domain summary
+_BG_MESH_ROW = "Background mesh size: {}x{}x{} cells\n".format
+
 
 class Domain(BoundingBox):
     minx: float = 0
@@ -128,7 +144,7 @@ class Domain(BoundingBox):
     def __repr__(self):
         return (
             super().__repr__() + "\n"
-            f"Background mesh size: {self.nx}x{self.ny}x{self.nz} cells\n"
+            + _BG_MESH_ROW(self.nx, self.ny, self.nz)
         )
 
     @staticmethod
@@ -312,9 +328,15 @@ class MeshSettings(BaseModel):
     geometry: dict[str, Geometry] = {}
 
     @property
-    def triSurfaceMeshGeometry(self):
+    def triSurfaceMeshGeometry(self) -> dict[str, TriSurfaceMeshGeometry]:
         return {k: v for k, v in self.geometry.items() if isinstance(v, TriSurfaceMeshGeometry)}
 
+    def tri_surface_geometry(self, name: str) -> TriSurfaceMeshGeometry:
+        geometry = self.geometry[name]
+        if type(geometry) is not TriSurfaceMeshGeometry:
+            raise TypeError(f"Geometry {name} is not a TriSurfaceMeshGeometry")
+        return geometry
+
 class SnappyHexMeshSettings(MeshSettings):
     snappyHexSteps: SnappyHexSteps = SnappyHexSteps()
     castellatedMeshControls: CastellatedMeshControls = CastellatedMeshControls()
@@ -599,6 +621,8 @@ class PostProcessSettings(BaseModel):
 
 
 class TransientInput(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     end_time: int
     time_step: int
     write_interval: int
@@ -617,41 +641,53 @@ class SimulationSettings(BaseModel):
     def set_half_model(self, is_half_model: bool):
         self.mesh.halfModel = is_half_model
         if is_half_model:
-            self.mesh.patches['back'].type = 'symmetry'
+            back = self.mesh.patches.get('back')
+            if back is not None and back.type != 'symmetry':
+                back.type = 'symmetry'
 
     def set_inlet_values(self, U: Optional[tuple[float, float, float]] = None):
         if (not self.mesh.internalFlow):  # external flow
             assert U is not None, "Inlet velocity is not set, required for external flow"
             self.boundaryConditions.velocityInlet.u_value = U
         else:  # internal flow
-            # Use inlet values from the stl file
-            # TODO: check this out and ensure it sets once
-            for geometry in self.mesh.geometry.values():
-                if isinstance(geometry, TriSurfaceMeshGeometry) and geometry.type == 'inlet':
-                    U_stl = cast(tuple[float, float, float], geometry.property or U)
-                    self.boundaryConditions.velocityInlet.u_value = U_stl
+            # Use inlet values from the stl file, the last inlet added takes precedence
+            inlet = next((geometry for geometry in reversed(self.mesh.geometry.values())
+                          if isinstance(geometry, TriSurfaceMeshGeometry) and geometry.type == 'inlet'), None)
+            if inlet is not None:
+                self.boundaryConditions.velocityInlet.u_value = cast(tuple[float, float, float], inlet.property or U)
 
     def set_transient_settings(self, transient: Union[TransientInput, Literal[False]]):
-        self.control.transient = isinstance(transient, TransientInput)
-        if isinstance(transient, TransientInput):
-            self.control.application = 'pimpleFoam'
-            self.control.endTime = transient.end_time
-            self.control.writeInterval = transient.write_interval
-            self.control.deltaT = transient.time_step
-            self.control.adjustTimeStep = 'no'
-            self.control.maxCo = 0.9
-            self.numerical.ddtSchemes.default = 'Euler'
-            # if steady state, SIMPLEC is used. If transient, PIMPLE is used
-            # for PIMPLE, the relaxation factors are set to 0.7 and p = 0.3
-            self.numerical.relaxationFactors.p = 0.3
+        if not isinstance(transient, TransientInput):
+            self.control.transient = False
+            return
+
+        self.control = self.control.model_copy(update={
+            "transient": True,
+            "application": 'pimpleFoam',
+            "endTime": transient.end_time,
+            "writeInterval": transient.write_interval,
+            "deltaT": transient.time_step,
+            "adjustTimeStep": 'no',
+            "maxCo": 0.9,
+        })
+        self.numerical.ddtSchemes.default = 'Euler'
+        # if steady state, SIMPLEC is used. If transient, PIMPLE is used
+        # for PIMPLE, the relaxation factors are set to 0.7 and p = 0.3
+        self.numerical.relaxationFactors.p = 0.3
 
 
     def set_post_process_settings(self, useFOs: bool):
-        self.postProcess.FOs = useFOs
-        meshPoint = self.mesh.castellatedMeshControls.locationInMesh
-        self.postProcess.massFlow = useFOs
-        self.postProcess.minMax = useFOs
-        self.postProcess.yPlus = useFOs
-        self.postProcess.forces = useFOs
+        # locationInMesh can be assigned as a list without validation, probes are kept in a set
+        meshPoint = cast(Location, tuple(self.mesh.castellatedMeshControls.locationInMesh))
+        post_process = self.postProcess
+        flags = (post_process.FOs, post_process.massFlow, post_process.minMax, post_process.yPlus, post_process.forces)
+        if any(flag != useFOs for flag in flags):
+            self.postProcess = post_process.model_copy(update={
+                "FOs": useFOs,
+                "massFlow": useFOs,
+                "minMax": useFOs,
+                "yPlus": useFOs,
+                "forces": useFOs,
+            })
         self.postProcess.probeLocations.add(meshPoint)
 
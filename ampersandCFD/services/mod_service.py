@@ -17,11 +17,11 @@
  */
 """
 
-
+from typing import Callable
 from ampersandCFD.models.inputs import StlInput
-from ampersandCFD.models.settings import BoundingBox, Domain, TriSurfaceMeshGeometry
+from ampersandCFD.models.settings import BoundingBox, Domain
 from ampersandCFD.services.project_service import ProjectService
-from ampersandCFD.utils.io import AmpersandDataInput, IOUtils, ModificationType
+from ampersandCFD.utils.io import REFINEMENT_AMOUNTS, AmpersandDataInput, IOUtils, ModificationType
 from ampersandCFD.models.project import AmpersandProject
 from ampersandCFD.utils.stl_analysis import StlAnalysis
 
@@ -30,19 +30,10 @@ from ampersandCFD.utils.stl_analysis import StlAnalysis
 class ModService:
     @staticmethod
     def modify_project(project: AmpersandProject, modification_type: ModificationType):
-        if modification_type == "Background Mesh":
-            ModService.change_background_mesh(project)
-        elif modification_type == "Mesh Point":
-            ModService.change_mesh_point(project)
-        elif modification_type == "Add Geometry":
-            ModService.add_geometry(project)
-        elif modification_type == "Refinement Levels":
-            ModService.change_refinement_levels(project)
-        elif modification_type == "Boundary Conditions":
-            ModService.change_boundary_conditions(project)
-        elif modification_type == "Fluid Properties":
-            ModService.change_fluid_properties(project)
-        raise ValueError("Invalid option. Aborting operation")
+        modify = _MODIFICATIONS.get(modification_type)
+        if modify is None:
+            raise ValueError("Invalid option. Aborting operation")
+        modify(project)
 
 
     @staticmethod
@@ -54,8 +45,7 @@ class ModService:
             IOUtils.print("Invalid refinement level, please enter the value again")
             ModService.change_refinement_levels(project)
 
-        ref_amounts = ["coarse", "medium", "fine"]
-        project.settings.mesh.refAmount = ref_amounts[ref_amount_index] # type: ignore
+        project.settings.mesh.refAmount = REFINEMENT_AMOUNTS[ref_amount_index]
 
     @staticmethod
     def change_domain_size(project: AmpersandProject, bounds: BoundingBox):
@@ -67,9 +57,9 @@ class ModService:
     @staticmethod
     def change_mesh_size(project: AmpersandProject, cellSize: float):
         nx, ny, nz = StlAnalysis.calc_nx_ny_nz(project.settings.mesh.domain, cellSize)
-        if (nx > 500 or ny > 500 or nz > 500):
+        if max(nx, ny, nz) > 500:
             IOUtils.print("Warning: Mesh is too fine. Consider increasing the cell size")
-        project.settings.mesh.domain = Domain.from_bbox(project.settings.mesh.domain, nx=nx, ny=ny, nz=nz)
+        project.settings.mesh.domain = project.settings.mesh.domain.model_copy(update={'nx': nx, 'ny': ny, 'nz': nz})
 
 
     # this will allow the user to change the refinement level of the stl file
@@ -79,11 +69,10 @@ class ModService:
         refMin = IOUtils.get_input_int("Enter new refMin: ")
         refMax = IOUtils.get_input_int("Enter new refMax: ")
         
-        stl_geoemtry = project.settings.mesh.geometry[stl_name]
-        assert isinstance(stl_geoemtry, TriSurfaceMeshGeometry), "Geometry is not a TriSurfaceMeshGeometry"
-        stl_geoemtry.refineMin = refMin
-        stl_geoemtry.refineMax = refMax
-        stl_geoemtry.featureLevel = refMax
+        stl_geometry = project.settings.mesh.tri_surface_geometry(stl_name)
+        stl_geometry.refineMin = refMin
+        stl_geometry.refineMax = refMax
+        stl_geometry.featureLevel = refMax
 
 
     # ---------------------------------------------------------------------#
@@ -136,18 +125,19 @@ class ModService:
     @staticmethod
     def choose_stl_file(project: AmpersandProject) -> str:
         stl_file_names = project.summarize_stl_files()
-        stl_file_number = IOUtils.get_input("Enter the number of the file: ")
-        try:
-            stl_file_number = int(stl_file_number)
-            if stl_file_number <= 0 or stl_file_number > len(stl_file_names):
-                raise ValueError("Invalid input. Please try again.")
-
-            project.summarize_stl_files()
-            return stl_file_names[stl_file_number-1]
-
-        except ValueError:
-            IOUtils.print("Invalid input. Please try again.")
-            return ModService.choose_stl_file(project)
+        while True:
+            stl_file_number = IOUtils.get_input("Enter the number of the file: ")
+            try:
+                stl_file_number = int(stl_file_number)
+                if stl_file_number <= 0 or stl_file_number > len(stl_file_names):
+                    raise ValueError("Invalid input. Please try again.")
+
+                stl_file_name = stl_file_names[stl_file_number-1]
+                IOUtils.print(f"Selected STL file: {stl_file_name}")
+                return stl_file_name
+
+            except ValueError:
+                IOUtils.print("Invalid input. Please try again.")
 
 
     @staticmethod
@@ -166,21 +156,23 @@ class ModService:
         IOUtils.print("Changing boundary conditions")
         boundary_conditions = project.summarize_boundary_conditions()
 
-        bc_number = IOUtils.get_input( "Enter the number of the boundary to change: ")
-        try:
-            bc_number = int(bc_number)
-            if bc_number <= 0 or bc_number > len(boundary_conditions):
-                IOUtils.print("Invalid input. Please try again.")
-            else:
+        while True:
+            bc_number = IOUtils.get_input( "Enter the number of the boundary to change: ")
+            try:
+                bc_number = int(bc_number)
+                if bc_number <= 0 or bc_number > len(boundary_conditions):
+                    IOUtils.print("Invalid input. Please try again.")
+                    continue
+
                 bc = boundary_conditions[bc_number-1]
                 IOUtils.print(f"Changing boundary condition for patch: {bc}")
                 patch_type = AmpersandDataInput.get_patch_type()
-                patch_property = AmpersandDataInput.get_patch_property()
+                patch_property = AmpersandDataInput.get_patch_property(patch_type)
 
                 project.update_patch(bc, patch_type, patch_property)
-        except ValueError:
-            IOUtils.print("Invalid input. Please try again.")
-            ModService.change_boundary_conditions(project)
+                return
+            except ValueError:
+                IOUtils.print("Invalid input. Please try again.")
 
     @staticmethod
     def change_fluid_properties(project: AmpersandProject):
@@ -191,3 +183,12 @@ class ModService:
         project.settings.physicalProperties.fluid = fluid
 
 
+# handlers for ModService.modify_project, keyed by modification type
+_MODIFICATIONS: dict[ModificationType, Callable[[AmpersandProject], object]] = {
+    "Background Mesh": ModService.change_background_mesh,
+    "Mesh Point": ModService.change_mesh_point,
+    "Add Geometry": ModService.add_geometry,
+    "Refinement Levels": ModService.change_refinement_levels,
+    "Boundary Conditions": ModService.change_boundary_conditions,
+    "Fluid Properties": ModService.change_fluid_properties,
+}
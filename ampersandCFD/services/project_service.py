@@ -1,22 +1,20 @@
+import os
 from pathlib import Path
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Optional, Union
 
 import yaml
-from ampersandCFD.generators.blockMeshDict import BlockMeshDictGenerator
-from ampersandCFD.generators.boundaryConditionDict import BoundaryConditionDictGenerator
-from ampersandCFD.generators.controlDict import ControlDictGenerator
-from ampersandCFD.generators.decomposeParDict import DecomposeParDictGenerator
-from ampersandCFD.generators.fvDict import FVDictGenerator
+try:
+    # libyaml bindings, when PyYAML was built with them
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
 from ampersandCFD.models.inputs import CreateProjectInput, PathLike, StlInput
 from ampersandCFD.models.settings import SimulationSettings
-from ampersandCFD.generators.postProcessDict import PostProcessGenerator
 from ampersandCFD.utils.io import IOUtils
 from ampersandCFD.models.project import AmpersandProject
-from ampersandCFD.generators.cmdScript import CmdScriptGenerator
-from ampersandCFD.generators.snappyHexMeshDict import SnappyHexMeshDictGenerator
-from ampersandCFD.generators.surfaceExtractorDict import SurfaceExtractorDictGenerator
-from ampersandCFD.generators.constantDict import ConstantDictGenerator
 from ampersandCFD.utils.stl_analysis import StlAnalysis
 
 
@@ -28,8 +26,22 @@ def represent_tuple(dumper, data):
     return dumper.represent_list(data)  # Convert tuple to list for YAML
 
 # Register custom representers
-yaml.add_representer(set, represent_set)
-yaml.add_representer(tuple, represent_tuple)
+yaml.add_representer(set, represent_set, Dumper=SafeDumper)
+yaml.add_representer(tuple, represent_tuple, Dumper=SafeDumper)
+
+# solver logs that mark a case as run
+_SOLVER_LOGS = frozenset({'log.simpleFoam', 'log.pimpleFoam'})
+
+def _missing_entries(directory: Path, names) -> set[str]:
+    """Return the names that are not entries of directory, stopping the scan once all are found."""
+    missing = set(names)
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            missing.discard(entry.name)
+            if not missing:
+                break
+    return missing
+
 
 class ProjectService:
     @staticmethod
@@ -50,6 +62,7 @@ class ProjectService:
 
 
         settings = SimulationSettings()
+        project = AmpersandProject(project_path, settings)
         if (input):
             settings.mesh.refAmount = input.refinement_amount
             settings.mesh.internalFlow = input.is_internal_flow
@@ -64,9 +77,6 @@ class ProjectService:
             settings.set_transient_settings(input.transient)
             settings.set_half_model(input.is_half_model)
 
-            project = AmpersandProject(project_path, settings)
-
-
             for stl_file in input.stl_files:
                 ProjectService.add_stl_file(project, stl_file)
 
@@ -81,7 +91,7 @@ class ProjectService:
     def load_project(project_path: PathLike):
         IOUtils.print(f"Loading project from path: {project_path}")
         with Path(project_path, "project_settings.yaml").open() as f:
-            settings = SimulationSettings.model_validate(yaml.safe_load(f))
+            settings = SimulationSettings.model_validate(yaml.load(f, Loader=SafeLoader))
         project = AmpersandProject(project_path, settings)
 
         ProjectService.validate_project(project)
@@ -91,19 +101,25 @@ class ProjectService:
 
     @staticmethod
     def write_project(project: AmpersandProject):
-        # Create required OpenFOAM directories 
+        # Create required OpenFOAM directories, listed shallow to deep so each
+        # mkdir only creates its own level; only the project root may need ancestors
+        project_path = project.project_path
         required_dirs = [
-            project.project_path / "0",
-            project.project_path / "constant",
-            project.project_path / "system",
-            project.project_path / "constant" / "triSurface"
+            project_path / "0",
+            project_path / "constant",
+            project_path / "system",
+            project_path / "constant" / "triSurface"
         ]
 
         try:
+            project_path.mkdir(parents=True, exist_ok=True)
             for directory in required_dirs:
-                if not directory.exists():
-                    directory.mkdir(parents=True)
-                    IOUtils.print(f"Created {directory} directory")
+                # mkdir reports an existing directory itself, no stat beforehand
+                try:
+                    directory.mkdir()
+                except FileExistsError:
+                    continue
+                IOUtils.print(f"Created {directory} directory")
         except OSError as e:
             raise OSError(f"Failed to create OpenFOAM directory structure: {e}")
         
@@ -113,9 +129,8 @@ class ProjectService:
     @staticmethod
     def write_settings(project: AmpersandProject):
         IOUtils.print("Writing settings to project_settings.yaml")
-        Path(project.project_path / "project_settings.yaml").write_text(
-            yaml.dump(project.settings.model_dump(), default_flow_style=False, sort_keys=False)
-        )
+        with open(project.project_path / "project_settings.yaml", "w") as f:
+            yaml.dump(project.settings.model_dump(), f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
 
 
  
@@ -124,29 +139,22 @@ class ProjectService:
         # Convert paths to Path objects
         stl_path = Path(stl_file.stl_path)
 
-        # Validate input file
-        if not stl_path.exists():
-            raise FileNotFoundError(f"STL file {stl_path} does not exist")
-            
-        StlAnalysis.add_stl_to_settings(project.settings, stl_path, stl_file.purpose, stl_file.property)
-
-        # Copy STL file to project
         dest_path = Path(project.project_path) / "constant" / "triSurface" / stl_path.name
-        # if dest_path.exists():
-        #     raise ValueError(f"STL file {stl_path.name} already exists in project")
 
+        # Copy STL file to project, setting the solid name of ASCII files on the way
         try:
-            dest_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(stl_path, dest_path)
+            project.ensure_directory(dest_path.parent)
+            renamed = StlAnalysis.copy_with_solid_name(stl_path, dest_path, dest_path.stem)
+            project.clear_stl_cache()
             IOUtils.print(f"Copied {dest_path.name} to {dest_path}")
+            if renamed:
+                IOUtils.print(f"Setting solid name for {dest_path}")
+        except FileNotFoundError:
+            raise FileNotFoundError(f"STL file {stl_path} does not exist")
         except OSError as e:
             raise RuntimeError(f"Failed to copy STL file: {e}")
 
-        # Set solid name in STL file
-        try:
-            StlAnalysis.set_stl_solid_name(dest_path)
-        except Exception as e:
-            raise RuntimeError(f"Failed to set STL solid name: {e}")
+        StlAnalysis.add_stl_to_settings(project.settings, stl_path, stl_file.purpose, stl_file.property)
 
         return dest_path
 
@@ -155,61 +163,86 @@ class ProjectService:
     def write_openfoam_files(project: AmpersandProject):
         if (not project.project_path.exists()):
             raise FileNotFoundError(f"Project not found at: {project.project_path}")
-        project_path = project.project_path
-        BoundaryConditionDictGenerator.write(project.settings.mesh, project.settings.boundaryConditions, project_path)
+        # the generators are only needed here, so importing the services doesn't load them
+        from ampersandCFD.generators.blockMeshDict import BlockMeshDictGenerator
+        from ampersandCFD.generators.boundaryConditionDict import BoundaryConditionDictGenerator
+        from ampersandCFD.generators.cmdScript import CmdScriptGenerator
+        from ampersandCFD.generators.constantDict import ConstantDictGenerator
+        from ampersandCFD.generators.controlDict import ControlDictGenerator
+        from ampersandCFD.generators.decomposeParDict import DecomposeParDictGenerator
+        from ampersandCFD.generators.fvDict import FVDictGenerator
+        from ampersandCFD.generators.postProcessDict import PostProcessGenerator
+        from ampersandCFD.generators.snappyHexMeshDict import SnappyHexMeshDictGenerator
+        from ampersandCFD.generators.surfaceExtractorDict import SurfaceExtractorDictGenerator
 
-        # go inside the constant directory
-        IOUtils.print("Creating constant properties")
-        ConstantDictGenerator.write(project.settings.physicalProperties, project_path)
+        project_path = project.project_path
+        settings = project.settings
+
+        # the generators only read the settings and each writes its own files, so they run concurrently
+        writes = [
+            partial(BoundaryConditionDictGenerator.write, settings.mesh, settings.boundaryConditions, project_path),
+            partial(ConstantDictGenerator.write, settings.physicalProperties, project_path),
+            partial(ControlDictGenerator.write, settings.control, project_path),
+            partial(BlockMeshDictGenerator.write, settings.mesh, project_path),
+            partial(SnappyHexMeshDictGenerator.write, settings.mesh, project_path),
+            partial(SurfaceExtractorDictGenerator.write, settings.mesh, "surfaceFeatureExtractDict", project_path),
+            partial(FVDictGenerator.write, settings.numerical, settings.solver, project_path),
+            partial(PostProcessGenerator.write, settings.mesh, settings.postProcess, project_path),
+            partial(CmdScriptGenerator.write, settings, project_path),
+        ]
+        if settings.parallel:
+            writes.append(partial(DecomposeParDictGenerator.write, settings.parallel, project_path))
 
-        # create the controlDict file
-        IOUtils.print("Creating the system files")
-        ControlDictGenerator.write(project.settings.control, project_path)
-        BlockMeshDictGenerator.write(project.settings.mesh, project_path)
-        SnappyHexMeshDictGenerator.write(project.settings.mesh, project_path)
-        
-        
-        SurfaceExtractorDictGenerator.write(project.settings.mesh, "surfaceFeatureExtractDict", project_path)
-        FVDictGenerator.write(project.settings.numerical, project.settings.solver, project_path)
-        if project.settings.parallel:
-            DecomposeParDictGenerator.write(project.settings.parallel, project_path)
-        PostProcessGenerator.write(project.settings.mesh, project.settings.postProcess, project_path)
-        CmdScriptGenerator.write(project.settings, project_path)
+        IOUtils.print_block(["Creating constant properties", "Creating the system files"])
+        with ThreadPoolExecutor(max_workers=min(8, len(writes))) as executor:
+            # result() re-raises the first failure in the caller
+            for future in [executor.submit(write) for write in writes]:
+                future.result()
 
-        IOUtils.print("\n-----------------------------------")
-        IOUtils.print("Project files created successfully!")
-        IOUtils.print("-----------------------------------\n")
+        IOUtils.print_block([
+            "\n-----------------------------------",
+            "Project files created successfully!",
+            "-----------------------------------\n",
+        ])
 
 
 
     @staticmethod
     def validate_project(project: Union[AmpersandProject, str, Path]):
         project_path = Path(project) if isinstance(project, (str, Path)) else project.project_path
-        ProjectService.check_directory(project_path / "0", project_path / "0.orig", copy=True)
-        ProjectService.check_directory(project_path / "constant")
-        ProjectService.check_directory(project_path / "system")
+        # one listing of the project answers the existence checks of the top level directories
+        try:
+            with os.scandir(project_path) as entries:
+                children = {entry.name for entry in entries}
+        except FileNotFoundError:
+            children = set()
+        ProjectService.check_directory(project_path / "0", project_path / "0.orig", copy=True, exists="0" in children)
+        ProjectService.check_directory(project_path / "constant", exists="constant" in children)
+        ProjectService.check_directory(project_path / "system", exists="system" in children)
         ProjectService.check_directory(project_path / "constant/triSurface", check_files=True)
 
 
 
     @staticmethod
-    def check_directory(path: Union[Path, str], fallback=None, copy=False, check_files=False):
+    def check_directory(path: Union[Path, str], fallback=None, copy=False, check_files=False, exists: Optional[bool] = None):
         path = Path(path)
-        if not path.exists():
+        if not (path.exists() if exists is None else exists):
             if fallback and Path(fallback).exists() and copy:
                 IOUtils.print(f"{fallback} directory found. Copying to {path}")
                 shutil.copytree(fallback, path)
             else:
                 raise FileNotFoundError(f"{path} directory not found.")
         if check_files:
-            if not list(path.iterdir()):
+            with os.scandir(path) as entries:
+                is_empty = next(entries, None) is None
+            if is_empty:
                 raise FileNotFoundError(f"No files found in {path}.")
 
     @staticmethod
     def check_log_files(project_path: PathLike):
-        project_path = Path(project_path)
-        log_files = list(project_path.iterdir())
-        if 'log.simpleFoam' in [f.name for f in log_files] or 'log.pimpleFoam' in [f.name for f in log_files]:
+        with os.scandir(project_path) as entries:
+            found = any(entry.name in _SOLVER_LOGS for entry in entries)
+        if found:
             IOUtils.print("Simulation log file found")
             return True
         IOUtils.print("No simulation log files found.")
@@ -217,26 +250,26 @@ class ProjectService:
 
     @staticmethod
     def check_post_process_files(project_path: PathLike):
-        project_path = Path(project_path)
-        post_process_path = project_path / "postProcessing/probe/0"
-        if not post_process_path.exists():
+        post_process_path = Path(project_path) / "postProcessing/probe/0"
+        try:
+            missing = _missing_entries(post_process_path, ('U', 'p'))
+        except FileNotFoundError:
             IOUtils.print(f"{post_process_path} directory does not exist.")
             return False
-        files = [f.name for f in post_process_path.iterdir()]
-        if 'U' not in files or 'p' not in files:
+        if missing:
             IOUtils.print("Required files 'U' and 'p' not found in postProcessing.")
             return False
         return True
 
     @staticmethod
     def check_forces_files(project_path: PathLike):
-        project_path = Path(project_path)
-        forces_path = project_path / "postProcessing/forces/0"
-        if not forces_path.exists():
+        forces_path = Path(project_path) / "postProcessing/forces/0"
+        try:
+            missing = _missing_entries(forces_path, ('force.dat',))
+        except FileNotFoundError:
             IOUtils.print(f"{forces_path} directory does not exist.")
             return False
-        files = [f.name for f in forces_path.iterdir()]
-        if 'force.dat' not in files:
+        if missing:
             IOUtils.print("force.dat file not found in forces directory.")
             return False
         return True
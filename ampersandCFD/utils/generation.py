@@ -1,3 +1,5 @@
+from functools import lru_cache
+from pathlib import Path
 from typing import Sequence
 
 
@@ -13,6 +15,31 @@ AMPERSAND_HEADER ="""
 -------------------------------------------------------------------------------
 """
 
+# the banner is spliced in once here, only the class and object names vary per header
+_FOAM_HEADER = """/*--------------------------------*- C++ -*----------------------------------*\\
+    """ + AMPERSAND_HEADER + """
+    This file is part of OpenFOAM casefiles automatically generated by AmpersandCFD*/
+
+    FoamFile
+    {{
+    version     2.0;
+    format      ascii;
+    class       {className};
+    object      {objectName};
+    }}"""
+
+# patch entries shared by the scalar and vector boundary condition helpers
+_FIXED_VALUE = """\n{}
+        {{
+            type            fixedValue;
+            value           uniform {};
+        }};"""
+
+_ZERO_GRADIENT = """\n{}
+        {{
+            type            zeroGradient;
+        }};"""
+
 
 class GenerationUtils:
     @staticmethod
@@ -25,54 +52,31 @@ class GenerationUtils:
 
     @staticmethod
     def createInternalFieldVector(type="uniform", value=[0.0, 0.0, 0.0]):
-        return f"""\ninternalField   {type} ({value[0]} {value[1]} {value[2]});"""
+        x, y, z = value
+        return f"""\ninternalField   {type} ({x} {y} {z});"""
 
     @staticmethod
     def createScalarFixedValue(patch_name="inlet", value=0):
-        return f"""\n{patch_name}
-        {{
-            type            fixedValue;
-            value           uniform {value};
-        }};"""
+        return _FIXED_VALUE.format(patch_name, value)
 
     @staticmethod
     def createScalarZeroGradient(patch_name="inlet"):
-        return f"""\n{patch_name}
-        {{
-            type            zeroGradient;
-        }};"""
+        return _ZERO_GRADIENT.format(patch_name)
 
     @staticmethod
     def createVectorFixedValue(patch_name="inlet", value=[0, 0, 0]):
-        return f"""\n{patch_name}
-        {{
-            type            fixedValue;
-            value           uniform ("{value[0]} {value[1]} {value[2]})";
-        }};"""
+        return _FIXED_VALUE.format(patch_name, GenerationUtils.createTupleString(value))
 
     @staticmethod
     def createVectorZeroGradient(patch_name="inlet"):
-        return f"""\n{patch_name}
-        {{
-            type            zeroGradient;
-        }};"""
+        return _ZERO_GRADIENT.format(patch_name)
 
     # This file contains the basic primitives used in the generation of OpenFOAM casefiles
 
     @staticmethod
+    @lru_cache(maxsize=64)
     def createFoamHeader(className="dictionary", objectName="blockMeshDict"):
-        header = f"""/*--------------------------------*- C++ -*----------------------------------*\\
-    {AMPERSAND_HEADER}
-    This file is part of OpenFOAM casefiles automatically generated by AmpersandCFD*/
-
-    FoamFile
-    {{
-    version     2.0;
-    format      ascii;
-    class       {className};
-    object      {objectName};
-    }}"""
-        return header
+        return _FOAM_HEADER.format(className=className, objectName=objectName)
 
     @staticmethod
     def create_field_header(className: str, objectName: str, dimensions: tuple, fieldType: str, fieldValue: float):
@@ -84,4 +88,15 @@ class GenerationUtils:
 
     @staticmethod
     def createTupleString(seq: Sequence):
-        return f"({seq[0]} {seq[1]} {seq[2]})"
+        x, y, z = seq
+        return f"({x} {y} {z})"
+
+    @staticmethod
+    def write_if_changed(path: Path, content: str):
+        """Write content to path unless the file already holds exactly that text, keeping its mtime."""
+        try:
+            if path.read_text() == content:
+                return
+        except (FileNotFoundError, UnicodeDecodeError):
+            pass
+        path.write_text(content)
@@ -20,7 +20,7 @@
 from typing import Any, Literal, Optional, Union, cast
 from tkinter import filedialog, Tk
 
-from ampersandCFD.models.inputs import FLUID_PYSICAL_PROPERTIES, FluidProperties, StlInput
+from ampersandCFD.models.inputs import FLUID_PYSICAL_PROPERTIES, FluidProperties, StlInput, get_fluid
 from ampersandCFD.models.settings import BoundingBox, RefinementAmount, PatchProperty, PatchType
 from ampersandCFD.utils.logger import logger
 
@@ -30,12 +30,25 @@ try:
 except:
     pass
 
+# Constant option tables shared by the prompts below
+_TRUE_INPUTS = frozenset({'y', 'yes', 'true', '1'})
+REFINEMENT_AMOUNTS: tuple[RefinementAmount, ...] = ("coarse", "medium", "fine")
+PATCH_PURPOSES: tuple[PatchType, ...] = ('wall', 'inlet', 'outlet', 'refinementRegion', 'refinementSurface',
+                                         'cellZone', 'baffles', 'symmetry', 'cyclic', 'empty',)
+
 ModificationType = Literal["Background Mesh", "Mesh Point", "Add Geometry", "Refinement Levels", "Boundary Conditions", "Fluid Properties", "Numerical Settings", "Simulation Control Settings", "Turbulence Model", "Post Processing Settings"]
 
 class IOUtils:
     GUIMode: bool = False
     window: Any = None
     verbose: bool = False
+
+    @staticmethod
+    def configure(window: Any = None, gui: bool = True):
+        """Route IOUtils output to a GUI window (anything with an updateTerminal method)."""
+        IOUtils.window = window
+        IOUtils.GUIMode = gui
+
     @staticmethod
     def print(*args):
         if IOUtils.GUIMode and IOUtils.window != None:
@@ -127,7 +140,7 @@ class IOUtils:
     @staticmethod
     def get_input_bool(prompt):
         try:
-            return input(prompt).lower() in ['y', 'yes', 'true', '1']
+            return input(prompt).lower() in _TRUE_INPUTS
         except:
             IOUtils.error(
                 "Invalid input. Please enter a boolean value.")
@@ -181,16 +194,24 @@ class IOUtils:
             return IOUtils.get_input("Select file: ")
 
     @staticmethod
-    def show_title(title):
+    def format_title(title):
         total_len = 60
         half_len = (total_len - len(title))//2
-        title = "-"*half_len + title + "-"*half_len
-        IOUtils.print("\n" + title)
+        return "\n" + "-"*half_len + title + "-"*half_len
+
+    @staticmethod
+    def show_title(title):
+        IOUtils.print(IOUtils.format_title(title))
 
     @staticmethod
     def print_line():
         IOUtils.print("-"*60)
 
+    @staticmethod
+    def print_block(lines):
+        """Emit several lines as a single message (one log record / terminal update)."""
+        IOUtils.print("\n".join(lines))
+
 
 class AmpersandDataInput:
     @staticmethod
@@ -278,34 +299,28 @@ class AmpersandDataInput:
         if (fluid_name > len(FLUID_PYSICAL_PROPERTIES) or fluid_name <= 0):
             IOUtils.print("Please input fluid properties manually.")
             return AmpersandDataInput.get_fluid_properties()
-        fluid = FLUID_PYSICAL_PROPERTIES[fluid_names[fluid_name-1]]
-        return fluid
+        return get_fluid(fluid_names[fluid_name-1])
 
     @staticmethod
     def get_mesh_refinement_amount() -> RefinementAmount:
-        ref_amounts = ["coarse", "medium", "fine"]
         ref_amount_index = IOUtils.get_input_int(
             "Enter the mesh refinement (0: coarse, 1: medium, 2: fine): ")
-        if ref_amount_index not in [0, 1, 2]:
+        if not 0 <= ref_amount_index < len(REFINEMENT_AMOUNTS):
             IOUtils.print("Invalid mesh refinement level. Defaulting to medium.")
             ref_amount_index = 1
-        return cast(RefinementAmount, ref_amounts[ref_amount_index])
+        return REFINEMENT_AMOUNTS[ref_amount_index]
 
 
     @staticmethod
     def get_patch_type() -> PatchType:
-        purposes = ['wall', 'inlet', 'outlet', 'refinementRegion', 'refinementSurface',
-                    'cellZone', 'baffles', 'symmetry', 'cyclic', 'empty',]
         IOUtils.print(f"Enter purpose for this STL geometry")
-        IOUtils.print_numbered_list(purposes)
+        IOUtils.print_numbered_list(PATCH_PURPOSES)
         purpose_no = IOUtils.get_input_int("Enter purpose number: ")-1
-        if (purpose_no < 0 or purpose_no > len(purposes)-1):
+        if (purpose_no < 0 or purpose_no > len(PATCH_PURPOSES)-1):
             IOUtils.print(
                 "Invalid purpose number. Setting purpose to wall")
-            purpose = 'wall'
-        else:
-            purpose = purposes[purpose_no]
-        return cast(PatchType, purpose)
+            return 'wall'
+        return PATCH_PURPOSES[purpose_no]
 
     @staticmethod
     def get_patch_property(purpose: PatchType='wall') -> Optional[PatchProperty]:
@@ -17,11 +17,18 @@
  */
 """
 
+import errno
+import hashlib
 import os
+import re
+import shutil
+import tempfile
+from functools import lru_cache
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 from pydantic import BaseModel
 import vtk
+from vtk.util.numpy_support import vtk_to_numpy
 import numpy as np
 import math
 from ampersandCFD.models.settings import BoundingBox, Domain, MeshSettings, SearchableBoxGeometry, SimulationSettings, TriSurfaceMeshGeometry, RefinementAmount, PatchType, PatchProperty
@@ -30,6 +37,71 @@ from ampersandCFD.thirdparty.stlToOpenFOAM import extract_curvature_data, comput
 from ampersandCFD.utils.io import IOUtils
 from ampersandCFD.utils.turbulence import TurbulenceUtils
 
+# solid/endsolid lines of an ASCII STL; group 1 is set for endsolid lines
+_SOLID_LINE = re.compile(rb'^(?:([^\n]*?endsolid)|[ \t]*solid)[^\r\n]*', re.IGNORECASE | re.MULTILINE)
+_RENAME_BLOCK_SIZE = 1 << 20
+
+
+# copy_file_range lets filesystems that support it (btrfs, xfs) reflink instead of copying;
+# any other failure of it falls back to shutil's sendfile/read-write copy
+def _copy_file(fsrc, size: int, dst: Union[str, Path]):
+    copy_file_range = getattr(os, 'copy_file_range', None)
+    if copy_file_range is not None:
+        with open(dst, 'wb') as fdst:
+            copied = 0
+            try:
+                while copied < size:
+                    n = copy_file_range(fsrc.fileno(), fdst.fileno(), size - copied, copied, copied)
+                    if n == 0:
+                        break
+                    copied += n
+                return
+            except OSError as e:
+                if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EPERM):
+                    raise
+    shutil.copyfile(fsrc.name, dst)
+
+
+# (block, renamed block) pairs of an ASCII STL read from the current position, each block
+# extended to the next line end so no solid/endsolid line is split between two blocks
+def _renamed_blocks(f, solid_name: str):
+    while block := f.read(_RENAME_BLOCK_SIZE):
+        block += f.readline()
+        yield block, StlAnalysis.rename_stl_solid(block, solid_name)
+
+
+# Content digest of a file keyed by its stat, so unchanged files are only hashed once
+@lru_cache(maxsize=64)
+def _file_digest(path: str, mtime_ns: int, size: int) -> bytes:
+    with open(path, 'rb') as f:
+        # file_digest (Python 3.11+) hashes straight from the file buffer without materializing the contents
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16)).digest()
+        digest = hashlib.blake2b(digest_size=16)
+        while chunk := f.read(1 << 20):
+            digest.update(chunk)
+        return digest.digest()
+
+
+# Bounding boxes of parsed STLs keyed by content digest, so re-adding the same geometry skips the vtk parse.
+# Full meshes of large STLs run into gigabytes, so only the most recently parsed one is kept alive.
+_STL_BBOX_CACHE_SIZE = 64
+_stl_bboxes: dict[bytes, BoundingBox] = {}
+_last_stl_mesh: dict[bytes, vtk.vtkPolyData] = {}
+
+# Per refinement amount: surface refinement level of walls, layer count of other patches, wall yPlus target
+_REF_LEVELS: dict[RefinementAmount, int] = {"coarse": 2, "medium": 4, "fine": 6}
+_N_LAYERS: dict[RefinementAmount, int] = {"coarse": 2, "medium": 4, "fine": 6}
+_TARGET_Y_PLUS: dict[RefinementAmount, int] = {"coarse": 70, "medium": 50, "fine": 30}
+# Background cell size divisors per refinement amount: (external flow, internal flow, slender internal flow);
+# the slender case divides the longest side, the others the shortest
+_BACKGROUND_CELL_DIVISORS: dict[RefinementAmount, tuple[float, float, float]] = {
+    "coarse": (3., 8., 50.),
+    "medium": (5., 12., 70.),
+    "fine": (7., 16., 90.),
+}
+
+
 class BoundaryLayer(BaseModel):
     yPlus: float
     y: float
@@ -110,7 +182,7 @@ class StlAnalysis:
         Re = U_val*L/nu
         Cf = 0.0592*Re**(-1./5.)
         tau = 0.5*rho*Cf*U_val**2.
-        uStar = np.sqrt(tau/rho)
+        uStar = math.sqrt(tau/rho)
         y = target_yPlus*nu/uStar
         return y
 
@@ -120,7 +192,7 @@ class StlAnalysis:
         Re = u*L/nu
         Cf = 0.0592*Re**(-1./5.)
         tau = 0.5*Cf*u**2.
-        uStar = np.sqrt(tau)
+        uStar = math.sqrt(tau)
         yPlus = uStar*y/nu
         return yPlus
 
@@ -133,24 +205,13 @@ class StlAnalysis:
     @staticmethod
     def calc_refinement_levels(max_cell_size=0.1, target_cell_size=0.001):
         size_ratio = max_cell_size / target_cell_size
-        n = np.log(size_ratio)/np.log(2.)
-        # print(n)
-        return int(np.ceil(n))
+        # log2 is exact for powers of two, where log(x)/log(2) can overshoot and round up a level
+        return math.ceil(math.log2(size_ratio))
 
     @staticmethod
     def calc_nx_ny_nz(domain_bbox: BoundingBox, target_cell_size: float):
-        domain_size = domain_bbox.size
-        nx = domain_size[0]/target_cell_size
-        ny = domain_size[1]/target_cell_size
-        nz = domain_size[2]/target_cell_size
-        nx, ny, nz = int(math.ceil(nx)), int(math.ceil(ny)), int(math.ceil(nz))
-        # it is better to have even number of cells
-        if nx % 2:  # if nx is odd
-            nx += 1
-        if ny % 2:  # if ny is odd
-            ny += 1
-        if nz % 2:  # if nz is odd
-            nz += 1
+        # it is better to have even number of cells, so odd counts are rounded up
+        nx, ny, nz = (n + n % 2 for n in (math.ceil(size/target_cell_size) for size in domain_bbox.size))
         return (nx, ny, nz)
 
     # Function to read STL file and compute bounding box
@@ -160,37 +221,74 @@ class StlAnalysis:
         bounds = mesh.GetBounds()
         return BoundingBox(minx=bounds[0], maxx=bounds[1], miny=bounds[2], maxy=bounds[3], minz=bounds[4], maxz=bounds[5])
 
+    @staticmethod
+    def stl_digest(stl_path: Union[str, Path]) -> bytes:
+        stat = os.stat(stl_path)
+        return _file_digest(os.fspath(stl_path), stat.st_mtime_ns, stat.st_size)
+
+    @staticmethod
+    def is_unchanged_copy(src: Union[str, Path], dst: Union[str, Path]) -> bool:
+        """Tell whether dst is src itself or an earlier copy of it, going by size and mtime like rsync does.
+
+        Plain copies get their source's timestamps, so this holds until either file changes.
+        """
+        try:
+            src_stat, dst_stat = os.stat(src), os.stat(dst)
+        except FileNotFoundError:
+            return False
+        if os.path.samestat(src_stat, dst_stat):
+            return True
+        return (src_stat.st_size, src_stat.st_mtime_ns) == (dst_stat.st_size, dst_stat.st_mtime_ns)
+
+    @staticmethod
+    def _parse_stl(key: bytes, stl_path: Union[str, Path]) -> vtk.vtkPolyData:
+        # the previous mesh is released before the next one is read, so at most one is ever held
+        _last_stl_mesh.clear()
+        mesh = read_stl_file(str(stl_path))
+        _last_stl_mesh[key] = mesh
+        if key not in _stl_bboxes:
+            if len(_stl_bboxes) >= _STL_BBOX_CACHE_SIZE:
+                _stl_bboxes.pop(next(iter(_stl_bboxes)))
+            _stl_bboxes[key] = StlAnalysis.compute_bounding_box(mesh)
+        return mesh
+
+    @staticmethod
+    def stl_bounds(stl_path: Union[str, Path]) -> BoundingBox:
+        """Bounding box of an STL, parsing it only if these contents were not seen before."""
+        key = StlAnalysis.stl_digest(stl_path)
+        if key not in _stl_bboxes:
+            StlAnalysis._parse_stl(key, stl_path)
+        # the bounding box ends up in the settings, so each caller gets its own copy
+        return _stl_bboxes[key].model_copy()
+
+    @staticmethod
+    def read_stl(stl_path: Union[str, Path]) -> tuple[vtk.vtkPolyData, BoundingBox]:
+        """Read an STL with vtk along with its bounding box, reusing the last parse of the same contents."""
+        key = StlAnalysis.stl_digest(stl_path)
+        mesh = _last_stl_mesh.get(key)
+        if mesh is None or key not in _stl_bboxes:
+            mesh = StlAnalysis._parse_stl(key, stl_path)
+        return mesh, _stl_bboxes[key].model_copy()
+
     # this is the wrapper function to check if a point is inside the mesh
     @staticmethod
     def is_point_inside(stl_file_path, point):
-        # Check if the file exists
-        if not os.path.exists(stl_file_path):
+        # the bounds are cached per file contents, so points outside them are rejected without a parse
+        try:
+            stl_bbox = StlAnalysis.stl_bounds(stl_file_path)
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"File not found: {stl_file_path}. Make sure the file exists.")
-        # Create a reader for the STL file
-        reader = vtk.vtkSTLReader()
-        reader.SetFileName(stl_file_path)
-        reader.Update()
-
-        # Get the output data from the reader
-        poly_data = reader.GetOutput()
-        # Calculate the bounding box
-        bounds = poly_data.GetBounds()
-        # Check if the point is inside the bounding box
-        xmin, xmax, ymin, ymax, zmin, zmax = bounds
-        if point[0] < xmin or point[0] > xmax:
-            return False
-        if point[1] < ymin or point[1] > ymax:
+        # Points outside the bounding box cannot be inside the mesh
+        if not stl_bbox.contains(point):
             return False
-        if point[2] < zmin or point[2] > zmax:
-            return False
-        # Check if the point is inside the mesh
+        poly_data, _ = StlAnalysis.read_stl(stl_file_path)
         return is_point_inside(poly_data, point)
 
     @staticmethod
     def calc_nLayer(yFirst=0.001, targetCellSize=0.1, expRatio=1.2):
-        n = np.log(targetCellSize*0.4/yFirst)/np.log(expRatio)
-        return int(np.ceil(n))
+        n = math.log(targetCellSize*0.4/yFirst)/math.log(expRatio)
+        return math.ceil(n)
 
 
     @staticmethod
@@ -199,18 +297,15 @@ class StlAnalysis:
     # delta: boundary layer thickness
     # expRatio: expansion ratio
     def calc_layers(yFirst=0.001, delta=0.01, expRatio=1.2):
-        currentThickness = yFirst*2.0  # initial thickness. Twice the yPlus value
-        currentDelta = 0
-        N = 0
-        for i in range(1, 50):
-            currentThickness = currentThickness*expRatio**(i)
-            currentDelta = currentDelta + currentThickness
-            if (currentDelta > delta):
-                N = i
-                break
-        finalLayerThickness = currentThickness
-
-        return N, finalLayerThickness
+        # layer i is expRatio**i thicker than layer i-1, i.e. 2*yFirst*expRatio**(i*(i+1)/2)
+        i = np.arange(1, 50)
+        with np.errstate(over='ignore'):
+            thicknesses = yFirst*2.0*np.power(float(expRatio), i*(i+1)/2)
+        # first layer whose cumulative thickness exceeds delta, N = 0 if none does
+        idx = int(np.searchsorted(np.cumsum(thicknesses), delta, side='right'))
+        if idx == len(thicknesses):
+            return 0, float(thicknesses[-1])
+        return idx + 1, float(thicknesses[idx])
 
 
     # this function calculates the smallest curvature of the mesh
@@ -227,31 +322,13 @@ class StlAnalysis:
         max_length = stl_bbox.max_length
         min_length = stl_bbox.min_length
         
-        if (refinement_amount == "coarse"):
-            if (internalFlow):
-                if max_length/min_length > 10:  # if the geometry is very slender
-                    return min(max_length/50., maxCellSize)
-                else:
-                    return min(min_length/8., maxCellSize)
-            else:
-                # this is the size of largest blockMesh cells
-                return min(min_length/3., maxCellSize)
-        elif (refinement_amount == "medium"):
-            if (internalFlow):
-                if max_length/min_length > 10:  # if the geometry is very slender
-                    return min(max_length/70., maxCellSize)
-                else:
-                    return min(min_length/12., maxCellSize)
-            else:
-                return min(min_length/5., maxCellSize)
-        else:
-            if (internalFlow):
-                if max_length/min_length > 10:  # if the geometry is very slender
-                    return min(max_length/90., maxCellSize)
-                else:
-                    return min(min_length/16., maxCellSize)
-            else:
-                return min(min_length/7., maxCellSize)
+        external_div, internal_div, slender_div = _BACKGROUND_CELL_DIVISORS[refinement_amount]
+        if (not internalFlow):
+            # this is the size of largest blockMesh cells
+            return min(min_length/external_div, maxCellSize)
+        if max_length/min_length > 10:  # if the geometry is very slender
+            return min(max_length/slender_div, maxCellSize)
+        return min(min_length/internal_div, maxCellSize)
 
 
 
@@ -263,8 +340,6 @@ class StlAnalysis:
             max_cell_size = characteristic_length/4.
 
         domain_size = StlAnalysis.calc_domain_bbox(stl_bbox, size_factor, settings.mesh.onGround, settings.mesh.internalFlow, settings.mesh.halfModel)
-        if (max_cell_size < 0.001):
-            max_cell_size = characteristic_length/4.
         background_cell_size = StlAnalysis.calc_background_cell_size(settings.mesh.refAmount, stl_bbox, max_cell_size, settings.mesh.internalFlow)
         nx, ny, nz = StlAnalysis.calc_nx_ny_nz(domain_size, background_cell_size)
         return Domain.from_bbox(domain_size, nx, ny, nz)
@@ -274,11 +349,7 @@ class StlAnalysis:
     def calc_boundary_layer(stl_bbox: BoundingBox, settings: SimulationSettings, target_cell_size: float):
         characteristic_length = stl_bbox.max_length
 
-        target_yPlus = {
-            "coarse": 70,
-            "medium": 50,
-            "fine": 30,
-        }[settings.mesh.refAmount]
+        target_yPlus = _TARGET_Y_PLUS[settings.mesh.refAmount]
         
         # this is the thickness of closest cell
         target_y = StlAnalysis.calc_y(
@@ -292,7 +363,7 @@ class StlAnalysis:
         first_layer_thickness = target_y*2.0
         final_layer_thickness = target_cell_size*0.35
 
-        num_layers = max(1, int(np.log(final_layer_thickness / first_layer_thickness)/np.log(settings.mesh.addLayersControls.expansionRatio)))
+        num_layers = max(1, int(math.log(final_layer_thickness / first_layer_thickness)/math.log(settings.mesh.addLayersControls.expansionRatio)))
 
     
         return BoundaryLayer(
@@ -305,52 +376,85 @@ class StlAnalysis:
 
     @staticmethod
     def calc_center_of_mass(mesh: vtk.vtkPolyData):
-        center_of_mass_filter = vtk.vtkCenterOfMass()
-        center_of_mass_filter.SetInputData(mesh)
-        center_of_mass_filter.Update()
-        center_of_mass = center_of_mass_filter.GetCenter()
-        return center_of_mass
+        # unweighted mean of the points, as vtkCenterOfMass computes it, over a zero-copy view of them
+        points = vtk_to_numpy(mesh.GetPoints().GetData())
+        return tuple(points.mean(axis=0, dtype=np.float64).tolist())
 
     @staticmethod
-    def get_location_in_mesh(mesh: vtk.vtkPolyData, is_internal_flow: bool) -> tuple[float, float, float]:
+    def get_location_in_mesh(mesh: vtk.vtkPolyData, is_internal_flow: bool, stl_bbox: Optional[BoundingBox] = None) -> tuple[float, float, float]:
+        # only the point for the current flow type is needed, the inside search is the costly one
+        if not is_internal_flow:
+            return StlAnalysis.get_outside_point(mesh, stl_bbox)
         center_of_mass = StlAnalysis.calc_center_of_mass(mesh)
-        outside_point = StlAnalysis.get_outside_point(mesh)
-        inside_point = find_inside_point(mesh, center_of_mass, min_bounds=None, max_bounds=None)
-        return tuple(inside_point if is_internal_flow else outside_point) # type: ignore
-        
-    @staticmethod 
-    def set_stl_solid_name(stl_file: Union[str, Path]) -> int:
-        stl_path = Path(stl_file)
-        IOUtils.print(f"Setting solid name for {stl_path}")
+        return tuple(find_inside_point(mesh, center_of_mass, min_bounds=None, max_bounds=None)) # type: ignore
         
-        if not stl_path.exists():
-            raise FileNotFoundError(f"STL file not found: {stl_path}")
-
-        if not stl_path.is_file():
-            raise ValueError(f"Path is not a file: {stl_path}")
-
-        # Extract solid name from filename without extension
-        solid_name = stl_path.stem
-
-        # Read and process file contents
-        lines = stl_path.read_text().splitlines()
-        new_lines = []
-        for line in lines:
-            if 'endsolid' in line.lower():
-                line = f"endsolid {solid_name}"
-            elif line.lower().lstrip().startswith('solid'):
-                line = f"solid {solid_name}"
-            new_lines.append(line + '\n')
-        
-        # Write back to file
-        stl_path.write_text(''.join(new_lines))
-        return 0
+    @staticmethod
+    def is_ascii_stl_data(header: bytes, file_size: int) -> bool:
+        """Tell ASCII STL contents apart from binary ones from the first 84 bytes.
 
-    
+        Binary STLs may also start with "solid", so the file size is compared
+        against the size implied by the binary triangle count as well.
+        """
+        if not header.lstrip().startswith(b'solid'):
+            return False
+        if len(header) >= 84:
+            n_triangles = int.from_bytes(header[80:84], 'little')
+            if file_size == 84 + 50*n_triangles:
+                return False
+        return True
+
+    @staticmethod
+    def rename_stl_solid(data: bytes, solid_name: str) -> bytes:
+        """Return ASCII STL contents with every solid/endsolid line renamed to solid_name."""
+        solid, endsolid = b"solid " + solid_name.encode(), b"endsolid " + solid_name.encode()
+        return _SOLID_LINE.sub(lambda m: solid if m.group(1) is None else endsolid, data)
 
     @staticmethod
-    def get_outside_point(mesh: vtk.vtkPolyData):
-        stl_bbox = StlAnalysis.compute_bounding_box(mesh)
+    def copy_with_solid_name(src: Union[str, Path], dst: Union[str, Path], solid_name: str) -> bool:
+        """Copy an STL file, renaming its solid on the way for ASCII files.
+
+        Files with nothing to rename (binary, or already named solid_name) are copied untouched
+        inside the kernel. ASCII files are renamed block by block into a temporary file that then
+        replaces dst, so they are never held in memory whole and src may be dst itself.
+        Returns whether the file is ASCII, i.e. carries a solid name.
+        """
+        dst_path = Path(dst)
+        tmp_path = None
+        try:
+            with open(src, 'rb') as f:
+                header = f.read(84)
+                src_stat = os.fstat(f.fileno())
+                size = src_stat.st_size
+                is_ascii = StlAnalysis.is_ascii_stl_data(header, size)
+                # the solid line leads the file, so a needed rename normally shows in the first block
+                f.seek(0)
+                if not (is_ascii and any(block != renamed for block, renamed in _renamed_blocks(f, solid_name))):
+                    # re-adding an unchanged file leaves the existing copy alone
+                    if not StlAnalysis.is_unchanged_copy(src, dst):
+                        _copy_file(f, size, dst)
+                        os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+                    return is_ascii
+                f.seek(0)
+                # a scratch file of our own next to dst, so concurrent adds don't share it and os.replace stays on one filesystem
+                fd, tmp_path = tempfile.mkstemp(prefix=f".{dst_path.name}.", suffix='.tmp', dir=dst_path.parent)
+                with open(fd, 'wb') as out:
+                    for _, renamed in _renamed_blocks(f, solid_name):
+                        out.write(renamed)
+            # mkstemp creates the file owner-only, so the renamed copy takes the permissions of its source
+            shutil.copymode(src, tmp_path)
+            # replaced only once src is closed, so an in-place rename also works on Windows
+            os.replace(tmp_path, dst_path)
+        except BaseException:
+            if tmp_path is not None:
+                Path(tmp_path).unlink(missing_ok=True)
+            raise
+        return True
+
+    @staticmethod
+    def get_outside_point(mesh: vtk.vtkPolyData, stl_bbox: Optional[BoundingBox] = None):
+        # callers that already hold the mesh bounds pass them in instead of recomputing them
+        if stl_bbox is None:
+            stl_bbox = StlAnalysis.compute_bounding_box(mesh)
         outsideX = stl_bbox.maxx + 0.05*(stl_bbox.maxx-stl_bbox.minx)
         outsideY = stl_bbox.miny*0.95  # (stlMaxY - stlMinY)/2.
         outsideZ = (stl_bbox.maxz - stl_bbox.minz)/2.
@@ -361,17 +465,12 @@ class StlAnalysis:
     @staticmethod
     def add_stl_to_settings(settings: SimulationSettings, stl_path: Union[str, Path], type: PatchType, property: PatchProperty):
         stl_name = Path(stl_path).name
-        stl_mesh = read_stl_file(str(stl_path))
-        stl_bbox = StlAnalysis.compute_bounding_box(stl_mesh)
+        stl_bbox = StlAnalysis.stl_bounds(stl_path)
 
         # Skip feature edges for refinement regions
         feature_edges = type not in ('refinementRegion', 'refinementSurface')
         
-        ref_level = {
-            "coarse": 2,
-            "medium": 4,
-            "fine": 6,
-        }[settings.mesh.refAmount]
+        ref_level = _REF_LEVELS[settings.mesh.refAmount]
 
         if (type == "wall"):
             # TODO: make this apply for multiple stl files in future
@@ -392,7 +491,9 @@ class StlAnalysis:
             settings.mesh.maxCellSize = background_cell_size
 
 
-            settings.mesh.castellatedMeshControls.locationInMesh = StlAnalysis.get_location_in_mesh(stl_mesh, settings.mesh.internalFlow)
+            # only walls need the mesh itself, usually still held from the bounds lookup above
+            stl_mesh, _ = StlAnalysis.read_stl(stl_path)
+            settings.mesh.castellatedMeshControls.locationInMesh = StlAnalysis.get_location_in_mesh(stl_mesh, settings.mesh.internalFlow, stl_bbox)
             
             box_ref_level = max(2, ref_level-3)
             refinement_boxes = StlAnalysis.get_refinement_boxes(stl_bbox, ref_level=box_ref_level, is_internal_flow=settings.mesh.internalFlow)
@@ -415,29 +516,25 @@ class StlAnalysis:
             delta = TurbulenceUtils.calc_delta(reynolds_number, characteristic_length)
 
 
-            IOUtils.print("\n-----------------Turbulence-----------------")
-            IOUtils.print(f"Target yPlus:{boundary_layer.yPlus}")
-            IOUtils.print(f'Reynolds number:{reynolds_number}')
-            IOUtils.print(f"Boundary layer thickness: {delta}")
-            IOUtils.print(f"Final layer thickness:{boundary_layer.final_layer_thickness}")
-            IOUtils.print(f"Number of layers:{boundary_layer.nLayers}")
-
-
             # print the summary of results
-            IOUtils.print("\n-----------------Mesh Settings-----------------")
-            IOUtils.print(stl_domain.__repr__())
-            IOUtils.print(f"Max cell size: {background_cell_size}")
-            IOUtils.print(f"Min cell size: {target_cell_size}")
-            IOUtils.print(f"Refinement Level:{ref_level}")
+            IOUtils.print_block([
+                "\n-----------------Turbulence-----------------",
+                f"Target yPlus:{boundary_layer.yPlus}",
+                f'Reynolds number:{reynolds_number}',
+                f"Boundary layer thickness: {delta}",
+                f"Final layer thickness:{boundary_layer.final_layer_thickness}",
+                f"Number of layers:{boundary_layer.nLayers}",
+                "\n-----------------Mesh Settings-----------------",
+                stl_domain.__repr__(),
+                f"Max cell size: {background_cell_size}",
+                f"Min cell size: {target_cell_size}",
+                f"Refinement Level:{ref_level}",
+            ])
 
 
         
         else:
-            n_layer = {
-                "coarse": 2,
-                "medium": 4,
-                "fine": 6,
-            }[settings.mesh.refAmount]
+            n_layer = _N_LAYERS[settings.mesh.refAmount]
             ref_min = 0
             ref_max = 0
             feature_level = 1